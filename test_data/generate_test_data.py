@@ -9,81 +9,68 @@ Parameters:
 - 10% with months on break 1-9, rest 0
 """
 
+import binascii
+import os
 import random
 import sys
-from datetime import datetime, timedelta
+from datetime import date
 
-def generate_random_address():
-    """Generate a random Ethereum address"""
-    return "0x" + ''.join(random.choices('0123456789abcdef', k=40))
+def generate_random_addresses(n):
+    """Generate n random Ethereum addresses (as ASCII bytes) from a single random blob"""
+    blob = binascii.hexlify(os.urandom(20 * n))
+    return [b"0x" + blob[i:i+40] for i in range(0, 40 * n, 40)]
 
 def generate_test_data(n=185, output_file="test_data/pgdata.txt"):
     """Generate n random member entries"""
 
-    # Current date
-    now = datetime.now()
-
-    # Date range: 10 years ago to now
-    ten_years_ago = now - timedelta(days=365*10)
-
-    members = []
-
-    for i in range(n):
-        # Generate random address
-        address = generate_random_address()
-
-        # Determine if member is in upper 60 months (60% chance)
-        if random.random() < 0.6:
-            # Upper 60 months (recent member)
-            # Random date within last 5 years
-            days_ago = random.randint(0, 60*30)  # Approximately 60 months
-            join_date = now - timedelta(days=days_ago)
-        else:
-            # Older member (40% chance)
-            # Random date between 5-10 years ago
-            days_ago = random.randint(60*30, 365*10)
-            join_date = now - timedelta(days=days_ago)
-
-        # Format as YYYY-MM-DD
-        join_date_str = join_date.strftime("%Y-%m-%d")
-
-        # Weight: 90% full-time (100), 10% part-time (50)
-        weight = 100 if random.random() < 0.9 else 50
-
-        # Months on break: 10% have 1-9 months, 90% have 0
-        if random.random() < 0.1:
-            months_on_break = random.randint(1, 9)
-        else:
-            months_on_break = 0
-
-        members.append({
-            'address': address,
-            'join_date': join_date_str,
-            'weight': weight,
-            'months_on_break': months_on_break,
-            'join_timestamp': join_date  # For sorting
-        })
-
-    # Sort by join date (oldest first)
-    members.sort(key=lambda x: x['join_timestamp'])
-
-    # Write to file
-    with open(output_file, 'w') as f:
-        for member in members:
-            f.write(f"{member['address']}\t{member['join_date']}\t{member['weight']}\t{member['months_on_break']}\n")
+    # Current date as a day ordinal; join dates are integer offsets from it
+    today = date.today().toordinal()
+
+    # Draw the fields column by column (one list per field)
+    rng = random.Random()
+
+    # 60% in upper 60 months (last ~5 years), 40% between 5-10 years ago
+    days_ago = [
+        rng.randint(0, 60*30) if rng.random() < 0.6 else rng.randint(60*30, 365*10)
+        for _ in range(n)
+    ]
+
+    # Weight: 90% full-time (100), 10% part-time (50)
+    weights = rng.choices((100, 50), cum_weights=(90, 100), k=n)
+
+    # Months on break: 10% have 1-9 months, 90% have 0
+    breaks = [rng.randint(1, 9) if rng.random() < 0.1 else 0 for _ in range(n)]
+
+    addresses = generate_random_addresses(n)
+
+    join_ordinals = [today - days for days in days_ago]
+
+    # Format lines (all fields are ASCII so format as bytes)
+    lines = []
+    for address, join_ordinal, weight, months_on_break in zip(addresses, join_ordinals, weights, breaks):
+        join_date = date.fromordinal(join_ordinal)
+        lines.append(b"%s\t%04d-%02d-%02d\t%d\t%d\n" % (
+            address, join_date.year, join_date.month, join_date.day, weight, months_on_break
+        ))
+
+    # Sort by join date (oldest first): sort indices, not the lines themselves
+    order = sorted(range(n), key=join_ordinals.__getitem__)
+
+    # Write to file (single write call)
+    with open(output_file, 'wb') as f:
+        f.write(b"".join(map(lines.__getitem__, order)))
 
     # Print statistics
     print(f"Generated {n} test members:")
     print(f"  Output: {output_file}")
 
-    # Calculate statistics
-    full_time = sum(1 for m in members if m['weight'] == 100)
-    part_time = sum(1 for m in members if m['weight'] == 50)
-    with_breaks = sum(1 for m in members if m['months_on_break'] > 0)
+    # Calculate statistics from the generated columns
+    full_time = weights.count(100)
+    part_time = weights.count(50)
+    with_breaks = n - breaks.count(0)
 
     # Count members in last 60 months
-    cutoff_60m = now - timedelta(days=60*30)
-    recent = sum(1 for m in members if m['join_timestamp'] >= cutoff_60m)
+    recent = sum(days <= 60*30 for days in days_ago)
 
     print(f"\nStatistics:")
     print(f"  Full-time (100%):     {full_time} ({full_time/n*100:.1f}%)")
@@ -93,11 +80,11 @@ def generate_test_data(n=185, output_file="test_data/pgdata.txt"):
     print(f"  Older (60m+):         {n-recent} ({(n-recent)/n*100:.1f}%)")
 
     # Date range
-    oldest = min(m['join_timestamp'] for m in members)
-    newest = max(m['join_timestamp'] for m in members)
+    oldest = today - max(days_ago)
+    newest = today - min(days_ago)
     print(f"\nDate range:")
-    print(f"  Oldest: {oldest.strftime('%Y-%m-%d')}")
-    print(f"  Newest: {newest.strftime('%Y-%m-%d')}")
+    print(f"  Oldest: {date.fromordinal(oldest).isoformat()}")
+    print(f"  Newest: {date.fromordinal(newest).isoformat()}")
 
 if __name__ == '__main__':
     n = int(sys.argv[1]) if len(sys.argv) > 1 else 185
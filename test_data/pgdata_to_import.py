@@ -7,23 +7,45 @@ Output: One hex payload per line (max 250 members per batch)
 
 import sys
 import re
+import struct
+import binascii
 
 BATCH_SIZE = 250
 
+# Member record layout (27 bytes total, big-endian):
+# - Address: 20 bytes
+# - Join year: 2 bytes (uint16)
+# - Join month: 1 byte (uint8)
+# - Part-time factor: 1 byte (uint8)
+# - Months on break: 2 bytes (uint16)
+# - Active: 1 byte (bool, default true = 1)
+MEMBER_FORMAT = "20sHBBHB"
+
 def convert_to_hex_batch(members):
     """Convert a batch of members to a single hex string"""
-    hex_parts = []
+    # Validated fields of all members, packed in a single call below
+    fields = []
 
     for member in members:
         address, join_date, weight, months_on_leave = member
 
         # Remove 0x prefix if present
-        address = address.replace('0x', '').strip().lower()
+        address = address.strip().lower()
+        if address.startswith('0x'):
+            address = address[2:]
 
         # Validate address length
         if len(address) != 40:
             raise ValueError(f"Invalid address length: {address} (expected 40 hex chars)")
 
+        # Decode address (validates hex digits)
+        try:
+            address_bytes = bytes.fromhex(address)
+        except ValueError:
+            raise ValueError(f"Invalid address: {address} (expected 40 hex chars)") from None
+        if len(address_bytes) != 20:
+            raise ValueError(f"Invalid address: {address} (expected 40 hex chars)")
+
         # Parse join date (YYYY-MM-DD)
         parts = join_date.split('-')
         if len(parts) != 3:
@@ -48,30 +70,12 @@ def convert_to_hex_batch(members):
         if not (0 <= months_on_leave <= 65535):
             raise ValueError(f"Invalid months on leave: {months_on_leave} (must be 0-65535)")
 
-        # Convert to hex (padded)
-        # Address: 20 bytes (already hex)
-        addr_hex = address
-
-        # Join year: 2 bytes (uint16, big-endian)
-        year_hex = f"{join_year:04x}"
-
-        # Join month: 1 byte (uint8)
-        month_hex = f"{join_month:02x}"
-
-        # Part-time factor: 1 byte (uint8)
-        part_time_hex = f"{weight:02x}"
-
-        # Months on break: 2 bytes (uint16, big-endian)
-        months_break_hex = f"{months_on_leave:04x}"
+        # Member fields in MEMBER_FORMAT order
+        fields += (address_bytes, join_year, join_month, weight, months_on_leave, 1)
 
-        # Active: 1 byte (bool, default true = 1)
-        active_hex = "01"
-
-        # Concatenate all fields (27 bytes total)
-        member_hex = f"{addr_hex}{year_hex}{month_hex}{part_time_hex}{months_break_hex}{active_hex}"
-        hex_parts.append(member_hex)
-
-    return "0x" + "".join(hex_parts)
+    # Pack the whole batch with one struct call and hex-encode it at once
+    buf = struct.pack(">" + MEMBER_FORMAT * len(members), *fields)
+    return "0x" + binascii.hexlify(buf).decode('ascii')
 
 def main():
     if len(sys.argv) != 2:
@@ -81,51 +85,66 @@ def main():
 
     data_file = sys.argv[1]
 
-    # Read and parse all members
-    members = []
-
+    # Read the whole file in one call
     try:
         with open(data_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
+            text = f.read()
+    except FileNotFoundError:
+        print(f"Error: File {data_file} not found", file=sys.stderr)
+        sys.exit(1)
 
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
+    # Diagnostics are collected and written to stderr in one call
+    log = []
 
-                # Parse tab-delimited fields
-                parts = line.split('\t')
-                if len(parts) != 4:
-                    print(f"Warning: Skipping line {line_num} (expected 4 fields, got {len(parts)})", file=sys.stderr)
-                    continue
+    # Parse all members
+    members = []
 
-                address, join_date, weight, months_on_leave = parts
+    for line_num, line in enumerate(text.split('\n'), 1):
+        line = line.strip()
 
-                # Skip entries with dashes (org members or invalid)
-                if join_date == '-':
-                    print(f"Skipping org member: {address}", file=sys.stderr)
-                    continue
+        # Skip empty lines and comments
+        if not line or line.startswith('#'):
+            continue
 
-                members.append((address, join_date, weight, months_on_leave))
+        # Parse tab-delimited fields
+        parts = line.split('\t')
+        if len(parts) != 4:
+            log.append(f"Warning: Skipping line {line_num} (expected 4 fields, got {len(parts)})")
+            continue
 
-    except FileNotFoundError:
-        print(f"Error: File {data_file} not found", file=sys.stderr)
-        sys.exit(1)
+        address, join_date, weight, months_on_leave = parts
+
+        # Skip entries with dashes (org members or invalid)
+        if join_date == '-':
+            log.append(f"Skipping org member: {address}")
+            continue
+
+        members.append((address, join_date, weight, months_on_leave))
 
     if not members:
-        print("Error: No valid members found in input file", file=sys.stderr)
+        log.append("Error: No valid members found in input file")
+        sys.stderr.write("\n".join(log) + "\n")
         sys.exit(1)
 
     # Batch members and output one hex string per line
     total_batches = (len(members) + BATCH_SIZE - 1) // BATCH_SIZE
 
-    print(f"# Processing {len(members)} members in {total_batches} batch(es) of up to {BATCH_SIZE} members each", file=sys.stderr)
+    log.append(f"# Processing {len(members)} members in {total_batches} batch(es) of up to {BATCH_SIZE} members each")
 
-    for i in range(0, len(members), BATCH_SIZE):
-        batch = members[i:i+BATCH_SIZE]
-        hex_payload = convert_to_hex_batch(batch)
-        print(hex_payload)
-        print(f"# Batch {i//BATCH_SIZE + 1}: {len(batch)} members, {len(hex_payload)} characters", file=sys.stderr)
+    payloads = []
+
+    try:
+        for i in range(0, len(members), BATCH_SIZE):
+            batch = members[i:i+BATCH_SIZE]
+            hex_payload = convert_to_hex_batch(batch)
+            payloads.append(hex_payload)
+            log.append(f"# Batch {i//BATCH_SIZE + 1}: {len(batch)} members, {len(hex_payload)} characters")
+    finally:
+        # Write all diagnostics, also when a batch fails validation
+        sys.stderr.write("\n".join(log) + "\n")
+
+    # Write all payloads in one call
+    sys.stdout.write("\n".join(payloads) + "\n")
 
 if __name__ == "__main__":
     main()